@@ -1,17 +1,44 @@
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
 from dotenv import load_dotenv
 
-load_dotenv()
 
-# API Keys
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-DATAFORSEO_LOGIN = os.getenv("DATAFORSEO_LOGIN")
-DATAFORSEO_PASSWORD = os.getenv("DATAFORSEO_PASSWORD")
+@dataclass(frozen=True)
+class Settings:
+    # API Keys
+    OPENAI_API_KEY: Optional[str]
+    DATAFORSEO_LOGIN: Optional[str]
+    DATAFORSEO_PASSWORD: Optional[str]
+
+    # Defaults
+    DEFAULT_LOCATION_CODE: int
+    DEFAULT_LANGUAGE_CODE: str
+    DEFAULT_DEVICE: str
+
+    # Anthropic API key (optional - for AI suggestions)
+    ANTHROPIC_API_KEY: Optional[str]
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load .env once and snapshot the environment into a Settings object"""
+    load_dotenv()
+
+    return Settings(
+        OPENAI_API_KEY=os.getenv("OPENAI_API_KEY"),
+        DATAFORSEO_LOGIN=os.getenv("DATAFORSEO_LOGIN"),
+        DATAFORSEO_PASSWORD=os.getenv("DATAFORSEO_PASSWORD"),
+        DEFAULT_LOCATION_CODE=int(os.getenv("DEFAULT_LOCATION_CODE", 2840)),  # US
+        DEFAULT_LANGUAGE_CODE=os.getenv("DEFAULT_LANGUAGE_CODE", "en"),
+        DEFAULT_DEVICE=os.getenv("DEFAULT_DEVICE", "desktop"),
+        ANTHROPIC_API_KEY=os.getenv("ANTHROPIC_API_KEY"),
+    )
 
-# Defaults
-DEFAULT_LOCATION_CODE = int(os.getenv("DEFAULT_LOCATION_CODE", 2840))  # US
-DEFAULT_LANGUAGE_CODE = os.getenv("DEFAULT_LANGUAGE_CODE", "en")
-DEFAULT_DEVICE = os.getenv("DEFAULT_DEVICE", "desktop")
 
-# Anthropic API key (optional - for AI suggestions)
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
\ No newline at end of file
+def refresh_settings() -> Settings:
+    """Drop the cached settings and read them from the environment again"""
+    get_settings.cache_clear()
+    return get_settings()
@@ -4,14 +4,12 @@ SEO Copilot MCP Server - stdio-based for Claude Desktop integration
 """
 
 import asyncio
-from datetime import datetime
+from collections import Counter
+from functools import partial
 import logging
-from typing import Any, List, Dict, Optional
-import os
-
-# Load environment variables FIRST
-from dotenv import load_dotenv
-load_dotenv()
+import re
+from typing import TYPE_CHECKING, Any, List, Dict, Optional
+from urllib.parse import urlsplit
 
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
@@ -22,26 +20,60 @@ from mcp.types import (
 from pydantic import AnyUrl
 import mcp.types as types
 
-# Import your existing services
-from services.dataforseo import fetch_live_serp
-from services.parser import extract_serp_titles
-from services.title_rewrite import suggest_better_titles
+from config import get_settings
+
+if TYPE_CHECKING:
+    from services.parser import ParsedResults
+
+# Service functions are bound on first use by _lazy_services() so that
+# starting the server doesn't pay for importing requests and the services
+fetch_live_serp = None
+parse_serp = None
+suggest_better_titles = None
+title_rewrite = None
 
 # Load config values from environment with fallbacks
-DEFAULT_LOCATION_CODE = int(os.getenv("DEFAULT_LOCATION_CODE", "2840"))  # US
-DEFAULT_LANGUAGE_CODE = os.getenv("DEFAULT_LANGUAGE_CODE", "en")
-DEFAULT_DEVICE = os.getenv("DEFAULT_DEVICE", "desktop")
+settings = get_settings()
+DEFAULT_LOCATION_CODE = settings.DEFAULT_LOCATION_CODE
+DEFAULT_LANGUAGE_CODE = settings.DEFAULT_LANGUAGE_CODE
+DEFAULT_DEVICE = settings.DEFAULT_DEVICE
+
+# Title patterns for the enhanced SERP analysis, compiled once at import
+POWER_WORDS = ('best', 'top', 'ultimate', 'complete', 'proven', 'guaranteed', 'exclusive', 'premium', 'leading', 'trusted', 'expert', 'professional', '#1', 'award', 'rated')
+_POWER_SET = frozenset(POWER_WORDS)
+_POWER_ORDER = {word: i for i, word in enumerate(POWER_WORDS)}
+_WORD_RE = re.compile(r'#?\w+')
+_YEAR_RE = re.compile(r'\b(20\d{2})\b')
+_DIGIT_RE = re.compile(r'\d')
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("seo-copilot-mcp")
 
 # Log the loaded configuration
-logger.info(f"Configuration loaded - Location: {DEFAULT_LOCATION_CODE}, Language: {DEFAULT_LANGUAGE_CODE}, Device: {DEFAULT_DEVICE}")
+logger.info("Configuration loaded - Location: %s, Language: %s, Device: %s", DEFAULT_LOCATION_CODE, DEFAULT_LANGUAGE_CODE, DEFAULT_DEVICE)
 
 # Create the MCP server
 server = Server("seo-copilot")
 
+def _lazy_services() -> None:
+    """Import the service layer the first time a tool needs it"""
+    global fetch_live_serp, parse_serp, suggest_better_titles, title_rewrite
+    if fetch_live_serp is not None:
+        return
+
+    from services.dataforseo import fetch_live_serp
+    from services.parser import parse_serp
+    from services import title_rewrite
+    from services.title_rewrite import suggest_better_titles
+
+def _url_netloc(url: str) -> str:
+    """Host part of a result URL as written (case, www. and port kept), or '' if it has none"""
+    try:
+        return urlsplit(url).netloc
+    except ValueError:
+        return ''
+
 @server.list_tools()
 async def handle_list_tools() -> List[Tool]:
     """List available tools"""
@@ -111,11 +143,14 @@ async def analyze_title_tool(arguments: dict) -> List[types.TextContent]:
         if not user_title or not user_title.strip():
             raise ValueError("User title parameter is required and cannot be empty")
 
-        logger.info(f"Analyzing title for query: {query}")
-        logger.info(f"Using location: {location_code}, language: {language_code}, device: {device}")
+        _lazy_services()
+
+        logger.info("Analyzing title for query: %s", query)
+        logger.info("Using location: %s, language: %s, device: %s", location_code, language_code, device)
 
         try:
-            serp = fetch_live_serp(
+            serp = await asyncio.to_thread(
+                fetch_live_serp,
                 keyword=query,
                 location_code=location_code,
                 language_code=language_code,
@@ -123,203 +158,236 @@ async def analyze_title_tool(arguments: dict) -> List[types.TextContent]:
             )
             logger.info("Using live SERP data from DataForSEO API")
         except Exception as e:
-            logger.error(f"Failed to fetch SERP: {e}")
+            logger.error("Failed to fetch SERP: %s", e)
             return [types.TextContent(type="text", text=f"❌ Error fetching SERP data:\n\n{str(e)}")]
 
-        from services.parser import extract_organic_results, extract_paa_questions
-        organic_results = extract_organic_results(serp)
-        paa_questions = extract_paa_questions(serp)
+        organic, paa_questions, by_domain = parse_serp(serp)
 
-        user_result = None
+        user_index = None
         user_ranking = None
-        user_duplicates = []
-        competitor_results = []
 
         clean_user_domain = user_domain.replace('www.', '') if user_domain else ''
-        for result in organic_results:
-            url = result.get('url', '')
-            result_domain = url.split('/')[2].lower().replace('www.', '') if url else ''
-            rank = result.get('position', result.get('rank_absolute', 0))
-
-            if clean_user_domain and result_domain == clean_user_domain:
-                if user_result is None or rank < user_ranking:
-                    user_result = result
-                    user_ranking = rank
-                    logger.info(f"Found user's domain at position {user_ranking}")
-                else:
-                    user_duplicates.append(result)
-            else:
-                competitor_results.append(result)
-
-        competitor_titles = [r.get("title", "") for r in competitor_results if r.get("title")]
-
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        use_ai_suggestions = api_key is not None and api_key.strip() != ""
-
-        suggestions_data = None
+        user_indices = by_domain.get(clean_user_domain, []) if clean_user_domain else []
+        if user_indices:
+            user_index = min(user_indices, key=organic.positions.__getitem__)
+            user_ranking = organic.positions[user_index]
+            logger.info("Found user's domain at position %s", user_ranking)
+
+        user_rows = set(user_indices)
+        competitors = organic.take(i for i in range(len(organic.titles)) if i not in user_rows)
+        competitor_titles = [title for title in competitors.titles if title]
+        lc_titles = [title.lower() for title in competitor_titles]
+
+        # Read through the module so services.title_rewrite.refresh_api_key() takes effect
+        use_ai_suggestions = title_rewrite.HAS_ANTHROPIC_KEY
+
+        # Submit the Claude call to the default executor straight away so it runs in a
+        # worker thread while the (synchronous) local analysis below is built
+        suggestions_future = None
         if use_ai_suggestions:
             logger.info("Using Anthropic API for AI-generated suggestions")
-            try:
-                suggestions_data = suggest_better_titles(
-                    query=query,
-                    user_title=user_title,
-                    competitor_titles=competitor_titles
-                )
-                logger.info(f"AI suggestions generated: {len(suggestions_data.get('suggestions', []))}")
-            except Exception as e:
-                logger.error(f"Error generating AI suggestions: {str(e)}")
-                suggestions_data = None
+            suggestions_future = asyncio.get_running_loop().run_in_executor(None, partial(
+                suggest_better_titles,
+                query=query,
+                user_title=user_title,
+                competitor_titles=competitor_titles
+            ))
         else:
             logger.info("No Anthropic API key found - falling back to manual analysis")
 
-        response_text = f"# SEO Title Analysis Results\n\n"
-        response_text += f"**Query analyzed:** {query}\n"
-        response_text += f"**Current title:** {user_title}\n"
-        response_text += f"**Your domain:** {user_domain or 'Not specified'}\n"
-        response_text += f"**Search location:** {location_code} ({language_code})\n"
-        response_text += f"**Device type:** {device}\n"
+        try:
+            enhanced_analysis = generate_enhanced_analysis(organic, competitor_titles, query, serp, lc_titles)
+
+            suggestions_data = None
+            if suggestions_future is not None:
+                try:
+                    suggestions_data = await suggestions_future
+                    logger.info("AI suggestions generated: %d", len(suggestions_data.get('suggestions', [])))
+                except Exception as e:
+                    logger.error("Error generating AI suggestions: %s", e)
+                    suggestions_data = None
+        finally:
+            # Never leave the Claude future behind if the analysis above raised or we were cancelled.
+            # The worker thread itself can't be interrupted; its request is bounded by its timeout.
+            if suggestions_future is not None:
+                if not suggestions_future.done():
+                    suggestions_future.cancel()
+                elif not suggestions_future.cancelled():
+                    suggestions_future.exception()  # mark any error as retrieved
+
+        parts: List[str] = [f"# SEO Title Analysis Results\n\n"]
+        parts.append(f"**Query analyzed:** {query}\n")
+        parts.append(f"**Current title:** {user_title}\n")
+        parts.append(f"**Your domain:** {user_domain or 'Not specified'}\n")
+        parts.append(f"**Search location:** {location_code} ({language_code})\n")
+        parts.append(f"**Device type:** {device}\n")
 
         if user_domain and user_ranking is not None:
-            response_text += f"**Your current ranking:** Position #{user_ranking}\n"
-            response_text += f"**Your current SERP title:** {user_result.get('title', 'N/A')}\n"
+            parts.append(f"**Your current ranking:** Position #{user_ranking}\n")
+            parts.append(f"**Your current SERP title:** {organic.titles[user_index] or 'N/A'}\n")
         elif user_domain:
-            response_text += f"**Your current ranking:** Not found in top {len(organic_results)} results\n"
+            parts.append(f"**Your current ranking:** Not found in top {len(organic.titles)} results\n")
 
-        response_text += f"**Competitor titles found:** {len(competitor_titles)}\n"
-        response_text += f"**Total organic results:** {len(organic_results)}\n"
-        response_text += f"**People Also Ask questions:** {len(paa_questions)}\n"
-        response_text += f"**Showing detailed analysis for:** Top {min(max_results, len(competitor_results))} competitor results\n"
-        response_text += f"**AI Suggestions:** {'Enabled' if use_ai_suggestions else 'Disabled (no API key)'}\n\n"
+        parts.append(f"**Competitor titles found:** {len(competitor_titles)}\n")
+        parts.append(f"**Total organic results:** {len(organic.titles)}\n")
+        parts.append(f"**People Also Ask questions:** {len(paa_questions)}\n")
+        parts.append(f"**Showing detailed analysis for:** Top {min(max_results, len(competitors.titles))} competitor results\n")
+        parts.append(f"**AI Suggestions:** {'Enabled' if use_ai_suggestions else 'Disabled (no API key)'}\n\n")
 
         if use_ai_suggestions and suggestions_data:
-            response_text += "## AI-Generated SEO Title Suggestions:\n\n"
+            parts.append("## AI-Generated SEO Title Suggestions:\n\n")
             for i, suggestion in enumerate(suggestions_data.get("suggestions", []), 1):
-                response_text += f"### Suggestion {i}\n"
-                response_text += f"**Title:** {suggestion.get('title', 'N/A')}\n"
-                response_text += f"**Meta Description:** {suggestion.get('description', 'N/A')}\n"
-                response_text += f"**Rationale:** {suggestion.get('rationale', 'N/A')}\n\n"
+                parts.append(f"### Suggestion {i}\n")
+                parts.append(f"**Title:** {suggestion.get('title', 'N/A')}\n")
+                parts.append(f"**Meta Description:** {suggestion.get('description', 'N/A')}\n")
+                parts.append(f"**Rationale:** {suggestion.get('rationale', 'N/A')}\n\n")
         else:
-            response_text += generate_seo_guidelines(query, user_title, competitor_titles, competitor_results, paa_questions, user_ranking)
+            parts.extend(generate_seo_guidelines(query, user_title, competitor_titles, competitors, paa_questions, user_ranking, lc_titles))
 
         if paa_questions:
-            response_text += "## People Also Ask Questions:\n\n"
+            parts.append("## People Also Ask Questions:\n\n")
             for i, question in enumerate(paa_questions, 1):
-                response_text += f"{i}. {question}\n"
-            response_text += "\n"
-
-        results_to_show = competitor_results[:max_results]
-        response_text += f"## Detailed Competitor Analysis (Top {len(results_to_show)} competitors):\n\n"
-        for i, result in enumerate(results_to_show, 1):
-            response_text += f"### Competitor #{i} (Position #{result.get('position', 'N/A')})\n"
-            response_text += f"**Title:** {result.get('title', 'N/A')}\n"
-            response_text += f"**URL:** {result.get('url', 'N/A')}\n"
-            response_text += f"**Domain:** {result.get('url', '').split('/')[2] if result.get('url') else 'N/A'}\n"
-            response_text += f"**Description:** {result.get('description', 'N/A')}\n\n"
-
-        enhanced_analysis = generate_enhanced_analysis(organic_results, competitor_titles, query, serp)
-        response_text += "\n## Enhanced SERP Analysis\n"
-        response_text += enhanced_analysis
-
-        response_text += "\n## Additional SERP Data for Analysis\n"
-        response_text += f"**Total SERP results:** {serp.get('se_results_count', 'N/A')}\n"
-        response_text += f"**Search performed:** {serp.get('datetime', 'N/A')}\n"
-        response_text += f"**Location:** {serp.get('location_code', 'N/A')}\n"
-        response_text += f"**Device:** {serp.get('device', 'N/A')}\n"
+                parts.append(f"{i}. {question}\n")
+            parts.append("\n")
+
+        results_to_show = competitors.take(range(min(max_results, len(competitors.titles))))
+        parts.append(f"## Detailed Competitor Analysis (Top {len(results_to_show.titles)} competitors):\n\n")
+        for i, (title, url, position, description, _) in enumerate(zip(*results_to_show), 1):
+            parts.append(f"### Competitor #{i} (Position #{position})\n")
+            parts.append(f"**Title:** {title}\n")
+            parts.append(f"**URL:** {url}\n")
+            parts.append(f"**Domain:** {_url_netloc(url) or 'N/A'}\n")
+            parts.append(f"**Description:** {description}\n\n")
+
+        parts.append("\n## Enhanced SERP Analysis\n")
+        parts.extend(enhanced_analysis)
+
+        parts.append("\n## Additional SERP Data for Analysis\n")
+        parts.append(f"**Total SERP results:** {serp.get('se_results_count', 'N/A')}\n")
+        parts.append(f"**Search performed:** {serp.get('datetime', 'N/A')}\n")
+        parts.append(f"**Location:** {serp.get('location_code', 'N/A')}\n")
+        parts.append(f"**Device:** {serp.get('device', 'N/A')}\n")
 
         logger.info("Returning structured analysis response to client")
-        return [types.TextContent(type="text", text=response_text)]
+        return [types.TextContent(type="text", text="".join(parts))]
 
     except ValueError as e:
-        logger.error(f"Validation error: {str(e)}")
+        logger.error("Validation error: %s", e)
         return [types.TextContent(type="text", text=f"❌ Invalid input:\n\n{str(e)}")]
     except Exception as e:
         import traceback
-        logger.error(f"Unhandled error: {str(e)}")
+        logger.error("Unhandled error: %s", e)
         logger.error(traceback.format_exc())
         return [types.TextContent(type="text", text=f"❌ Unexpected error:\n\n{str(e)}")]
 
-def generate_seo_guidelines(query: str, user_title: str, competitor_titles: List[str], competitor_results: List[Dict], paa_questions: List[str], user_ranking: Optional[int] = None) -> str:
+def generate_seo_guidelines(query: str, user_title: str, competitor_titles: List[str], competitor_results: "ParsedResults", paa_questions: List[str], user_ranking: Optional[int] = None, lc_titles: Optional[List[str]] = None) -> List[str]:
     """Generate SEO guidelines and analysis based on SERP data"""
+    if lc_titles is None:
+        lc_titles = [title.lower() for title in competitor_titles]
     
-    guidelines = "## SEO Analysis & Guidelines\n\n"
+    guidelines = ["## SEO Analysis & Guidelines\n\n"]
     
     # Current position analysis
     if user_ranking:
-        guidelines += f"### Your Current Performance\n"
-        guidelines += f"- **Current ranking:** Position #{user_ranking}\n"
-        guidelines += f"- **Opportunity:** {'Good position - optimize to move higher' if user_ranking <= 10 else 'Significant improvement opportunity'}\n\n"
+        guidelines.append(f"### Your Current Performance\n")
+        guidelines.append(f"- **Current ranking:** Position #{user_ranking}\n")
+        guidelines.append(f"- **Opportunity:** {'Good position - optimize to move higher' if user_ranking <= 10 else 'Significant improvement opportunity'}\n\n")
     else:
-        guidelines += f"### Your Current Performance\n"
-        guidelines += f"- **Current ranking:** Not found in top results\n"
-        guidelines += f"- **Opportunity:** Significant optimization needed to enter top rankings\n\n"
+        guidelines.append(f"### Your Current Performance\n")
+        guidelines.append(f"- **Current ranking:** Not found in top results\n")
+        guidelines.append(f"- **Opportunity:** Significant optimization needed to enter top rankings\n\n")
+    
+    # Title length analysis, accumulating total, min and max in one pass
+    total_length = 0
+    titles_counted = 0
+    min_length = max_length = 0
+    for title in competitor_titles:
+        if not title:
+            continue
+        length = len(title)
+        if titles_counted == 0 or length < min_length:
+            min_length = length
+        if length > max_length:
+            max_length = length
+        total_length += length
+        titles_counted += 1
     
-    # Title length analysis
-    if competitor_titles:
-        title_lengths = [len(title) for title in competitor_titles if title]
-        if title_lengths:
-            avg_length = sum(title_lengths) / len(title_lengths)
-            guidelines += f"### Title Length Analysis\n"
-            guidelines += f"- **Your title length:** {len(user_title)} characters\n"
-            guidelines += f"- **Average competitor length:** {avg_length:.1f} characters\n"
-            guidelines += f"- **Competitor range:** {min(title_lengths)} - {max(title_lengths)} characters\n"
-            guidelines += f"- **Recommendation:** Optimal title length is 50-60 characters\n\n"
+    if titles_counted:
+        avg_length = total_length / titles_counted
+        guidelines.append(f"### Title Length Analysis\n")
+        guidelines.append(f"- **Your title length:** {len(user_title)} characters\n")
+        guidelines.append(f"- **Average competitor length:** {avg_length:.1f} characters\n")
+        guidelines.append(f"- **Competitor range:** {min_length} - {max_length} characters\n")
+        guidelines.append(f"- **Recommendation:** Optimal title length is 50-60 characters\n\n")
     
     # Keyword analysis
+    # One alternation over the query words so each title is scanned once, in C
     query_words = query.lower().split()
-    titles_with_keyword = sum(1 for title in competitor_titles if any(word in title.lower() for word in query_words))
+    if query_words:
+        keyword_search = re.compile('|'.join(map(re.escape, query_words))).search
+        titles_with_keyword = sum(map(bool, map(keyword_search, lc_titles)))
+        user_has_keyword = keyword_search(user_title.lower()) is not None
+    else:
+        titles_with_keyword = 0
+        user_has_keyword = False
     
-    guidelines += f"### Keyword Usage Analysis\n"
-    guidelines += f"- **Competitor titles containing target keyword:** {titles_with_keyword}/{len(competitor_titles)}\n"
-    guidelines += f"- **Your title contains keyword:** {'Yes' if any(word in user_title.lower() for word in query_words) else 'No'}\n"
-    guidelines += f"- **Recommendation:** Include target keyword near the beginning of title\n\n"
+    guidelines.append(f"### Keyword Usage Analysis\n")
+    guidelines.append(f"- **Competitor titles containing target keyword:** {titles_with_keyword}/{len(competitor_titles)}\n")
+    guidelines.append(f"- **Your title contains keyword:** {'Yes' if user_has_keyword else 'No'}\n")
+    guidelines.append(f"- **Recommendation:** Include target keyword near the beginning of title\n\n")
     
     return guidelines
 
-def generate_enhanced_analysis(organic_results: List[Dict], competitor_titles: List[str], query: str, serp: Dict) -> str:
+def generate_enhanced_analysis(organic_results: "ParsedResults", competitor_titles: List[str], query: str, serp: Dict, lc_titles: Optional[List[str]] = None) -> List[str]:
     """Generate enhanced SERP analysis with quick wins"""
+    from datetime import datetime
+    if lc_titles is None:
+        lc_titles = [title.lower() for title in competitor_titles]
     
-    analysis = ""
+    analysis: List[str] = []
     
     if not competitor_titles:
-        return "No competitor titles available for enhanced analysis.\n"
+        return ["No competitor titles available for enhanced analysis.\n"]
     
-    # Power words analysis
-    power_words = ['best', 'top', 'ultimate', 'complete', 'proven', 'guaranteed', 'exclusive', 'premium', 'leading', 'trusted', 'expert', 'professional', '#1', 'award', 'rated']
-    power_word_usage = {}
-    for word in power_words:
-        count = sum(1 for title in competitor_titles if word.lower() in title.lower())
-        if count > 0:
-            power_word_usage[word] = count
+    # Single pass over the titles collecting every per-title signal
+    current_year = str(datetime.now().year)
+    power_word_usage = Counter()
+    titles_with_current_year = 0
+    titles_with_any_year = 0
+    titles_with_numbers = 0
+    titles_with_pipes = 0
+    titles_with_dashes = 0
+    for title, title_lc in zip(competitor_titles, lc_titles):
+        power_word_usage.update(_POWER_SET.intersection(_WORD_RE.findall(title_lc)))
+        years = _YEAR_RE.findall(title)
+        titles_with_current_year += current_year in years
+        titles_with_any_year += bool(years)
+        titles_with_numbers += _DIGIT_RE.search(title) is not None
+        titles_with_pipes += '|' in title
+        titles_with_dashes += ' - ' in title
     
+    # Power words analysis
     if power_word_usage:
-        analysis += "### Power Words Analysis\n"
-        for word, count in sorted(power_word_usage.items(), key=lambda x: x[1], reverse=True):
-            analysis += f"- **'{word}':** used in {count}/{len(competitor_titles)} titles\n"
-        analysis += "\n"
+        analysis.append("### Power Words Analysis\n")
+        for word, count in sorted(power_word_usage.items(), key=lambda x: (-x[1], _POWER_ORDER[x[0]])):
+            analysis.append(f"- **'{word}':** used in {count}/{len(competitor_titles)} titles\n")
+        analysis.append("\n")
     
     # Year and freshness analysis
-    current_year = str(datetime.now().year)
-    titles_with_current_year = sum(1 for title in competitor_titles if current_year in title)
-    titles_with_any_year = sum(1 for title in competitor_titles if any(year in title for year in ['2024', '2025', '2023']))
-    
-    analysis += "### Freshness & Date Analysis\n"
-    analysis += f"- **Titles with {current_year}:** {titles_with_current_year}/{len(competitor_titles)}\n"
-    analysis += f"- **Titles with any year:** {titles_with_any_year}/{len(competitor_titles)}\n"
+    analysis.append("### Freshness & Date Analysis\n")
+    analysis.append(f"- **Titles with {current_year}:** {titles_with_current_year}/{len(competitor_titles)}\n")
+    analysis.append(f"- **Titles with any year:** {titles_with_any_year}/{len(competitor_titles)}\n")
     freshness_recommendation = "Include current year" if titles_with_any_year > len(competitor_titles) * 0.3 else "Year not critical for this query"
-    analysis += f"- **Recommendation:** {freshness_recommendation}\n\n"
+    analysis.append(f"- **Recommendation:** {freshness_recommendation}\n\n")
     
     # Numbers analysis
-    titles_with_numbers = sum(1 for title in competitor_titles if any(char.isdigit() for char in title))
-    analysis += f"### Numbers Usage\n"
-    analysis += f"- **Titles with numbers:** {titles_with_numbers}/{len(competitor_titles)}\n\n"
+    analysis.append(f"### Numbers Usage\n")
+    analysis.append(f"- **Titles with numbers:** {titles_with_numbers}/{len(competitor_titles)}\n\n")
     
     # Title structure analysis
-    titles_with_pipes = sum(1 for title in competitor_titles if '|' in title)
-    titles_with_dashes = sum(1 for title in competitor_titles if ' - ' in title)
-    
-    analysis += "### Title Structure Patterns\n"
-    analysis += f"- **Using pipe separators (|):** {titles_with_pipes}/{len(competitor_titles)}\n"
-    analysis += f"- **Using dash separators (-):** {titles_with_dashes}/{len(competitor_titles)}\n\n"
+    analysis.append("### Title Structure Patterns\n")
+    analysis.append(f"- **Using pipe separators (|):** {titles_with_pipes}/{len(competitor_titles)}\n")
+    analysis.append(f"- **Using dash separators (-):** {titles_with_dashes}/{len(competitor_titles)}\n\n")
     
     return analysis
 
@@ -352,4 +420,4 @@ async def main():
         )
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -1,11 +1,12 @@
-from pydantic import BaseModel
+from dataclasses import dataclass, field
 from typing import List, Optional
 
-class SerpEntry(BaseModel):
+@dataclass(slots=True)
+class SerpEntry:
     keyword: str
     title: str
     url: str
     position: int
     language: Optional[str] = None
     location_name: Optional[str] = None
-    serp_features: Optional[List[str]] = []
+    serp_features: Optional[List[str]] = field(default_factory=list)
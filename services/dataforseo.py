@@ -1,6 +1,91 @@
+import logging
+import os
+import sqlite3
+import time
 import requests
-from typing import Optional
-from config import DATAFORSEO_LOGIN, DATAFORSEO_PASSWORD
+from cachetools import TLRUCache
+from diskcache import Cache, Timeout
+from requests.adapters import HTTPAdapter
+from threading import Lock
+from typing import Optional, Tuple
+from urllib3.util.retry import Retry
+from config import get_settings
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional
+    from json import loads as json_loads
+
+logger = logging.getLogger(__name__)
+
+# Shared session so the connection to DataForSEO is kept alive between calls,
+# retrying with backoff only when the request was never processed: connect
+# errors, 429 (rate limited) and 503 (unavailable). The live SERP call is
+# billed, so read errors/timeouts and 502/504 gateway errors are not retried,
+# since DataForSEO may already have run and charged the request.
+_RETRY = Retry(
+    total=3,
+    read=False,
+    backoff_factor=0.3,
+    status_forcelist=(429, 503),
+    allowed_methods=frozenset(["POST"]),
+    raise_on_status=False
+)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_RETRY))
+
+# Recent SERP result blocks keyed by (keyword, location_code, language_code, device),
+# kept in memory and on disk so paid lookups survive server restarts. In memory
+# each entry is (result, expires_at) with expires_at in time.time() seconds, so
+# an entry loaded from disk keeps the expiry it was written with.
+SERP_CACHE_TTL = 3600
+
+def _serp_entry_expiry(_key: tuple, entry: Tuple[dict, float], _now: float) -> float:
+    """Expiry time stored with an in-memory SERP cache entry"""
+    return entry[1]
+
+_serp_cache = TLRUCache(maxsize=256, ttu=_serp_entry_expiry, timer=time.time)
+_serp_cache_lock = Lock()
+_SERP_DISK_DIR = os.path.expanduser("~/.cache/seo-copilot/serp")
+_serp_disk = None
+_serp_disk_failed = False
+_serp_disk_lock = Lock()
+
+# Errors that make the disk cache unusable; it is best-effort, so these are logged and skipped
+_DISK_ERRORS = (OSError, sqlite3.Error, Timeout)
+
+def _get_serp_disk() -> Optional[Cache]:
+    """Open the on-disk SERP cache on first use, or return None if it can't be opened"""
+    global _serp_disk, _serp_disk_failed
+    with _serp_disk_lock:
+        if _serp_disk is None and not _serp_disk_failed:
+            try:
+                _serp_disk = Cache(_SERP_DISK_DIR)
+            except _DISK_ERRORS as e:
+                logger.warning("SERP disk cache unavailable, caching in memory only: %s", e)
+                _serp_disk_failed = True
+        return _serp_disk
+
+def _disk_get(key: tuple) -> Tuple[Optional[dict], Optional[float]]:
+    """Cached SERP result block from disk and its expiry time, or (None, None) on a miss or disk error"""
+    disk = _get_serp_disk()
+    if disk is None:
+        return None, None
+    try:
+        return disk.get(key, expire_time=True)
+    except _DISK_ERRORS as e:
+        logger.warning("SERP disk cache read failed: %s", e)
+        return None, None
+
+def _disk_set(key: tuple, result: dict) -> None:
+    """Store a SERP result block on disk, ignoring disk errors"""
+    disk = _get_serp_disk()
+    if disk is None:
+        return
+    try:
+        disk.set(key, result, expire=SERP_CACHE_TTL)
+    except _DISK_ERRORS as e:
+        logger.warning("SERP disk cache write failed: %s", e)
 
 def fetch_live_serp(
     keyword: str, 
@@ -11,12 +96,26 @@ def fetch_live_serp(
     user_dataforseo_password: Optional[str] = None
 ) -> dict:
     # Use user credentials if provided, otherwise fall back to default
-    login = user_dataforseo_login or DATAFORSEO_LOGIN
-    password = user_dataforseo_password or DATAFORSEO_PASSWORD
+    settings = get_settings()
+    login = user_dataforseo_login or settings.DATAFORSEO_LOGIN
+    password = user_dataforseo_password or settings.DATAFORSEO_PASSWORD
 
     if not login or not password:
         raise RuntimeError("Missing DataForSEO credentials. Please provide credentials in the MCP configuration.")
 
+    key = (keyword, location_code, language_code, device)
+    with _serp_cache_lock:
+        entry = _serp_cache.get(key)
+    if entry is not None:
+        return entry[0]
+
+    cached, expires_at = _disk_get(key)
+    if cached is not None:
+        if expires_at is not None:
+            with _serp_cache_lock:
+                _serp_cache[key] = (cached, expires_at)
+        return cached
+
     url = "https://api.dataforseo.com/v3/serp/google/organic/live/advanced"
 
     payload = [
@@ -29,10 +128,11 @@ def fetch_live_serp(
     ]
 
     try:
-        response = requests.post(
+        response = _SESSION.post(
             url,
             auth=(login, password),
-            json=payload
+            json=payload,
+            timeout=30
         )
 
         if response.status_code == 401:
@@ -41,7 +141,10 @@ def fetch_live_serp(
         if response.status_code != 200:
             raise RuntimeError(f"DataForSEO API error: {response.status_code} - {response.text}")
 
-        data = response.json()
+        try:
+            data = json_loads(response.content)
+        except ValueError:
+            raise RuntimeError("Malformed DataForSEO response")
 
         # Check for errors in the API response
         if data.get("status_code") != 20000:
@@ -49,9 +152,14 @@ def fetch_live_serp(
             raise RuntimeError(f"DataForSEO API error: {error_message}")
 
         try:
-            return data["tasks"][0]["result"][0]  # This is the actual SERP result block
+            result = data["tasks"][0]["result"][0]  # This is the actual SERP result block
         except (KeyError, IndexError):
             raise RuntimeError("Malformed DataForSEO response")
+
+        with _serp_cache_lock:
+            _serp_cache[key] = (result, time.time() + SERP_CACHE_TTL)
+        _disk_set(key, result)
+        return result
             
     except requests.exceptions.RequestException as e:
-        raise RuntimeError(f"Request to DataForSEO failed: {str(e)}")
\ No newline at end of file
+        raise RuntimeError(f"Request to DataForSEO failed: {str(e)}")
@@ -1,4 +1,63 @@
-from typing import List, Dict
+from collections import defaultdict
+from typing import Iterable, List, Dict, NamedTuple
+from urllib.parse import urlsplit
+
+class ParsedResults(NamedTuple):
+    """Organic results as parallel lists, one entry per result"""
+    titles: List[str]
+    urls: List[str]
+    positions: List[int]
+    descriptions: List[str]
+    domains: List[str]
+
+    def take(self, indices: Iterable[int]) -> "ParsedResults":
+        """Return the results at the given indices, in that order"""
+        indices = list(indices)
+        return ParsedResults(*([column[i] for i in indices] for column in self))
+
+class ParsedSerp(NamedTuple):
+    organic: ParsedResults
+    paa: List[str]
+    by_domain: Dict[str, List[int]]
+
+def parse_serp(dataforseo_response: Dict) -> ParsedSerp:
+    """
+    Extract organic results and PAA questions in a single pass
+    
+    Args:
+        dataforseo_response: The SERP result block from DataForSEO
+    
+    Returns:
+        ParsedSerp with the organic results as parallel lists, the PAA questions
+        and the organic result indices grouped by domain
+    """
+    organic = ParsedResults([], [], [], [], [])
+    paa_questions = []
+    by_domain = defaultdict(list)
+
+    for item in dataforseo_response.get("items", []):
+        item_type = item.get("type")
+        if item_type == "organic":
+            url = item.get("url", "")
+            domain = url_domain(url)
+            by_domain[domain].append(len(organic.titles))
+            organic.titles.append(item.get("title", ""))
+            organic.urls.append(url)
+            organic.positions.append(item.get("rank_group", 0))
+            organic.descriptions.append(item.get("description", ""))
+            organic.domains.append(domain)
+        elif item_type == "people_also_ask":
+            paa_questions.extend(_paa_element_questions(item))
+
+    return ParsedSerp(organic, paa_questions, dict(by_domain))
+
+def url_domain(url: str) -> str:
+    """Lower-cased host of a URL without a leading 'www.', or '' if it has none"""
+    try:
+        host = urlsplit(url).hostname or ""
+    except ValueError:
+        return ""
+    return host[4:] if host.startswith("www.") else host
 
 def extract_serp_titles(dataforseo_response: Dict) -> List[str]:
     """
@@ -35,13 +94,7 @@ def extract_paa_questions(dataforseo_response: Dict) -> List[str]:
     
     for item in items:
         if item.get("type") == "people_also_ask":
-            # Extract questions from PAA items
-            paa_items = item.get("items", [])
-            for paa_item in paa_items:
-                if paa_item.get("type") == "people_also_ask_element":
-                    question = paa_item.get("title", "")
-                    if question:
-                        paa_questions.append(question)
+            paa_questions.extend(_paa_element_questions(item))
     
     return paa_questions
 
@@ -67,24 +120,38 @@ def extract_organic_results(dataforseo_response: Dict) -> List[Dict]:
         if item.get("type") != "organic":
             continue
 
-        organic_results.append({
-            "keyword": keyword,
-            "title": item.get("title", ""),
-            "url": item.get("url", ""),
-            "domain": item.get("domain", ""),
-            "description": item.get("description", ""),
-            "position": item.get("rank_group", 0),
-            "rank_absolute": item.get("rank_absolute", 0),
-            "language": language_code,
-            "location_name": location_name,
-            "breadcrumb": item.get("breadcrumb", ""),
-            "website_name": item.get("website_name", ""),
-            "is_featured_snippet": item.get("is_featured_snippet", False),
-            "rating": item.get("rating", None),
-            "highlighted": item.get("highlighted", []),
-            "links": item.get("links", []),
-            "faq": item.get("faq", None),
-            "timestamp": item.get("timestamp", None)
-        })
-
-    return organic_results
\ No newline at end of file
+        organic_results.append(_organic_result(item, keyword, location_name, language_code))
+
+    return organic_results
+
+def _paa_element_questions(paa_block: Dict) -> List[str]:
+    """Extract the questions from a single people_also_ask item"""
+    questions = []
+    for paa_item in paa_block.get("items", []):
+        if paa_item.get("type") == "people_also_ask_element":
+            question = paa_item.get("title", "")
+            if question:
+                questions.append(question)
+    return questions
+
+def _organic_result(item: Dict, keyword: str, location_name: str, language_code: str) -> Dict:
+    """Build the organic result dictionary for a single organic item"""
+    return {
+        "keyword": keyword,
+        "title": item.get("title", ""),
+        "url": item.get("url", ""),
+        "domain": item.get("domain", ""),
+        "description": item.get("description", ""),
+        "position": item.get("rank_group", 0),
+        "rank_absolute": item.get("rank_absolute", 0),
+        "language": language_code,
+        "location_name": location_name,
+        "breadcrumb": item.get("breadcrumb", ""),
+        "website_name": item.get("website_name", ""),
+        "is_featured_snippet": item.get("is_featured_snippet", False),
+        "rating": item.get("rating", None),
+        "highlighted": item.get("highlighted", []),
+        "links": item.get("links", []),
+        "faq": item.get("faq", None),
+        "timestamp": item.get("timestamp", None)
+    }
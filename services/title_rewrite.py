@@ -1,70 +1,114 @@
-import os
 import json
 import requests
-from typing import List, Dict
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from threading import Lock
+from typing import List, Dict, Optional
 import logging
 import re
 
-logger = logging.getLogger(__name__)
+from config import get_settings, refresh_settings
 
-import os
-import json
-import requests
-from typing import List, Dict
-import logging
-import re
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional
+    from json import loads as json_loads
 
 logger = logging.getLogger(__name__)
 
+# Shared session so the connection to the Anthropic API is kept alive between calls
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_SESSION.headers.update({
+    "content-type": "application/json",
+    "anthropic-version": "2023-06-01"
+})
+
+# The API key is read once at import; call refresh_api_key() to pick up a changed key
+HAS_ANTHROPIC_KEY = False
+
+def _apply_api_key(api_key: Optional[str]) -> None:
+    """Set HAS_ANTHROPIC_KEY and the session's x-api-key header from the given key"""
+    global HAS_ANTHROPIC_KEY
+    HAS_ANTHROPIC_KEY = bool(api_key and api_key.strip())
+    if HAS_ANTHROPIC_KEY:
+        _SESSION.headers["x-api-key"] = api_key
+    else:
+        _SESSION.headers.pop("x-api-key", None)
+
+def refresh_api_key() -> bool:
+    """Re-read the settings from the environment and switch to the current Anthropic key"""
+    _apply_api_key(refresh_settings().ANTHROPIC_API_KEY)
+    return HAS_ANTHROPIC_KEY
+
+_apply_api_key(get_settings().ANTHROPIC_API_KEY)
+
+# Recent suggestion results keyed by (query, user_title, top_titles)
+_suggestions_cache = TTLCache(maxsize=256, ttl=6 * 3600)
+_suggestions_cache_lock = Lock()
+
+_PROMPT_TEMPLATE = """\
+You are an expert SEO assistant.
+
+Your task is to suggest 5 **click-optimized** meta titles and descriptions for the query: "{query}".
+The current page title is:
+"{user_title}"
+
+Here are current top SERP titles:
+{top_titles_block}
+
+🧠 Use this data to guide your suggestions — aim to outperform these titles with better structure, CTR appeal, and relevance.
+
+🎯 Follow these rules strictly:
+- Return **exactly 5** suggestions
+- Titles: 50–65 characters
+- Descriptions: 120–160 characters
+- Emojis only if SERP uses them (at start or end)
+- Each suggestion must include: title, description, rationale
+
+📦 Format your response **exactly** like this:
+```json
+{{
+  "suggestions": [
+    {{
+      "title": "Example title",
+      "description": "Example description",
+      "rationale": "Reason this works"
+    }},
+    ... (5 total)
+  ]
+}}
+```
+Return **only this JSON block**, no commentary or text outside it."""
+
+# Matches the ```json ... ``` block Claude is asked to reply with
+_JSON_BLOCK_RE = re.compile(r'```json\s*({.*?})\s*```', re.DOTALL)
+
+_SYSTEM_MSG = "You are an expert SEO assistant that provides helpful, accurate, and well-structured title and description suggestions."
+
 def suggest_better_titles(query: str, user_title: str, competitor_titles: List[str]) -> Dict:
     """Generate SEO title suggestions using Claude (Anthropic) API"""
 
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key or not api_key.strip():
+    if not HAS_ANTHROPIC_KEY:
         logger.error("ANTHROPIC_API_KEY environment variable not set or empty")
         raise RuntimeError("ANTHROPIC_API_KEY environment variable not set or empty")
 
     top_titles = competitor_titles[:10]
-    prompt = (
-        "You are an expert SEO assistant.\n\n"
-        f"Your task is to suggest 5 **click-optimized** meta titles and descriptions for the query: \"{query}\".\n"
-        f"The current page title is:\n\"{user_title}\"\n\n"
-        "Here are current top SERP titles:\n"
-        + '\n'.join(f"- {t}" for t in top_titles) + "\n\n"
-        "🧠 Use this data to guide your suggestions — aim to outperform these titles with better structure, CTR appeal, and relevance.\n\n"
-        "🎯 Follow these rules strictly:\n"
-        "- Return **exactly 5** suggestions\n"
-        "- Titles: 50–65 characters\n"
-        "- Descriptions: 120–160 characters\n"
-        "- Emojis only if SERP uses them (at start or end)\n"
-        "- Each suggestion must include: title, description, rationale\n\n"
-        "📦 Format your response **exactly** like this:\n"
-        "```json\n"
-        "{\n"
-        "  \"suggestions\": [\n"
-        "    {\n"
-        "      \"title\": \"Example title\",\n"
-        "      \"description\": \"Example description\",\n"
-        "      \"rationale\": \"Reason this works\"\n"
-        "    },\n"
-        "    ... (5 total)\n"
-        "  ]\n"
-        "}\n"
-        "```\n"
-        "Return **only this JSON block**, no commentary or text outside it."
-    )
-
-    headers = {
-        "x-api-key": api_key,
-        "content-type": "application/json",
-        "anthropic-version": "2023-06-01"
-    }
+    key = (query, user_title, tuple(top_titles))
+    with _suggestions_cache_lock:
+        cached = _suggestions_cache.get(key)
+    if cached is not None:
+        logger.info("Using cached Claude suggestions")
+        return cached
+
+    top_titles_block = "\n".join(map("- {}".format, top_titles))
+    prompt = _PROMPT_TEMPLATE.format(query=query, user_title=user_title, top_titles_block=top_titles_block)
 
     data = {
         "model": "claude-3-haiku-20240307",
         "max_tokens": 2000,
         "temperature": 0.7,
-        "system": "You are an expert SEO assistant that provides helpful, accurate, and well-structured title and description suggestions.",
+        "system": _SYSTEM_MSG,
         "messages": [
             {
                 "role": "user",
@@ -75,14 +119,17 @@ def suggest_better_titles(query: str, user_title: str, competitor_titles: List[s
 
     try:
         logger.info("Sending request to Claude API...")
-        response = requests.post(
+        response = _SESSION.post(
             "https://api.anthropic.com/v1/messages",
-            headers=headers,
             json=data,
             timeout=30
         )
         response.raise_for_status()
-        result = response.json()
+        try:
+            result = json_loads(response.content)
+        except ValueError as e:
+            logger.error("Claude API returned a non-JSON body: %s", e)
+            raise RuntimeError(f"Claude API error: invalid JSON response ({str(e)})")
 
         content = result.get("content", [{}])[0].get("text", "")
         logger.info("Parsing Claude response...")
@@ -90,21 +137,21 @@ def suggest_better_titles(query: str, user_title: str, competitor_titles: List[s
         parsed = None
 
         # Try extracting JSON from ```json ... ``` block
-        match = re.search(r'```json\s*({.*?})\s*```', content, re.DOTALL)
+        match = _JSON_BLOCK_RE.search(content)
         if match:
             try:
-                parsed = json.loads(match.group(1))
+                parsed = json_loads(match.group(1))
                 logger.info("Parsed Claude response from JSON code block")
             except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON from code block: {e}")
+                logger.error("Failed to parse JSON from code block: %s", e)
         else:
             # Try parsing full content as raw JSON
             try:
-                parsed = json.loads(content)
+                parsed = json_loads(content)
                 logger.info("Parsed Claude response as direct JSON")
             except json.JSONDecodeError as e:
                 logger.error("Claude response was not valid JSON")
-                logger.debug(f"Raw content: {content[:300]}...")
+                logger.debug("Raw content: %s...", content[:300])
                 parsed = {"suggestions": []}
 
         if not parsed or "suggestions" not in parsed:
@@ -112,16 +159,22 @@ def suggest_better_titles(query: str, user_title: str, competitor_titles: List[s
             parsed = {"suggestions": []}
 
         if len(parsed["suggestions"]) != 5:
-            logger.warning(f"Claude returned {len(parsed['suggestions'])} suggestions instead of 5")
+            logger.warning("Claude returned %d suggestions instead of 5", len(parsed["suggestions"]))
 
-        return {
+        suggestions_data = {
             "query": query,
             "user_title": user_title,
             "top_serp_titles": top_titles,
             "suggestions": parsed["suggestions"]
         }
 
+        # Only keep usable answers so a bad response is retried next time
+        if parsed["suggestions"]:
+            with _suggestions_cache_lock:
+                _suggestions_cache[key] = suggestions_data
+        return suggestions_data
+
     except requests.exceptions.RequestException as e:
-        logger.error(f"Request error: {e}")
+        logger.error("Request error: %s", e)
         raise RuntimeError(f"Claude API error: {str(e)}")
 